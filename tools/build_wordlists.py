@@ -0,0 +1,21 @@
+"""
+Precompile the word lists into wordle/words.pkl so invocations skip text parsing.
+
+Run via `make wordlists` (or `python -m tools.build_wordlists` from the repo root)
+after changing words.txt/solutions.txt.
+"""
+
+import pickle
+
+from wordle.words import PICKLE_PATH, build_word_lists
+
+
+def main() -> None:
+    """Parse the text word lists and pickle them next to the package data."""
+    with PICKLE_PATH.open("wb") as pickle_file:
+        pickle.dump(build_word_lists(), pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"wrote {PICKLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
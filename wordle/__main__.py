@@ -1,4 +1,5 @@
 """Main module entry point"""
+
 from typing import Optional
 
 import arrow
@@ -21,7 +22,16 @@ from wordle.words import random_word, word_of_the_day
         "word of that date."
     ),
 )
-def main(date_str: Optional[str]) -> None:
+@click.option(
+    "--animate/--no-animate",
+    default=True,
+    show_default=True,
+    help=(
+        "Animate letter reveals and pause on the end-of-game message. Disabling is "
+        "useful on slow terminals."
+    ),
+)
+def main(date_str: Optional[str], animate: bool) -> None:
     """Play a game of Wordle."""
     match date_str:
         case "today":
@@ -34,7 +44,7 @@ def main(date_str: Optional[str]) -> None:
             except arrow.parser.ParserError as parser_error:
                 raise click.BadArgumentUsage(parser_error)
             solution = word_of_the_day(date=date)
-    Game(solution=solution).play()
+    Game(solution=solution, animate=animate).play()
 
 
 if __name__ == "__main__":
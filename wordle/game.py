@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import string
+import functools
 import sys
 import time
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Literal
 
 import attr
@@ -18,6 +20,7 @@ from rich.markup import render
 from rich.style import Style
 from rich.table import Table
 
+from wordle import words
 from wordle.exception import (
     EmptyRowException,
     FullRowException,
@@ -25,13 +28,26 @@ from wordle.exception import (
     TooShortException,
 )
 from wordle.getch import getch
-from wordle.words import ALL_WORDS
 
 DARK_GRAY = "#585858"
 LIGHT_GRAY = "#d7dadc"
 GREEN = "#538d4e"
 YELLOW = "#b59f3b"
 
+# interned styles, shared by every cell that renders with them
+BORDER_LIGHT_GRAY = Style(color=LIGHT_GRAY)
+BORDER_DARK_GRAY = Style(color=DARK_GRAY)
+BORDER_YELLOW = Style(color=YELLOW)
+BORDER_GREEN = Style(color=GREEN)
+TEXT_BOLD = Style(bold=True)
+TEXT_NORMAL = Style(bold=False)
+TEXT_DARK_GRAY_BOLD = Style(color=DARK_GRAY, bold=True)
+TEXT_DARK_GRAY_NORMAL = Style(color=DARK_GRAY, bold=False)
+TEXT_YELLOW_BOLD = Style(color=YELLOW, bold=True)
+TEXT_YELLOW_NORMAL = Style(color=YELLOW, bold=False)
+TEXT_GREEN_BOLD = Style(color=GREEN, bold=True)
+TEXT_GREEN_NORMAL = Style(color=GREEN, bold=False)
+
 NUM_COLS = 5
 NUM_ROWS = 6
 
@@ -39,6 +55,12 @@ RANKS = ["Genius", "Magnificent", "Impressive", "Splendid", "Great", "Phew"]
 
 KB_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
 
+KB_LOCATION = {
+    letter: row_idx for row_idx, kb_row in enumerate(KB_ROWS) for letter in kb_row
+}
+
+KB_ROW_REGIONS = [f"kb-row-{row_idx}" for row_idx in range(len(KB_ROWS))]
+
 STATE_ORDER = {
     state: order
     for order, state in enumerate(["empty", "filled", "absent", "present", "correct"])
@@ -46,39 +68,59 @@ STATE_ORDER = {
 
 StateT = Literal["empty", "filled", "absent", "present", "correct"]
 
+# state -> (border style, text style), one table per boldness
+_STYLES_BOLD: dict[StateT, tuple[Style, Style]] = {
+    "empty": (BORDER_LIGHT_GRAY, TEXT_BOLD),
+    "filled": (BORDER_LIGHT_GRAY, TEXT_BOLD),
+    "absent": (BORDER_DARK_GRAY, TEXT_DARK_GRAY_BOLD),
+    "present": (BORDER_YELLOW, TEXT_YELLOW_BOLD),
+    "correct": (BORDER_GREEN, TEXT_GREEN_BOLD),
+}
+_STYLES_NORMAL: dict[StateT, tuple[Style, Style]] = {
+    "empty": (BORDER_LIGHT_GRAY, TEXT_NORMAL),
+    "filled": (BORDER_LIGHT_GRAY, TEXT_NORMAL),
+    "absent": (BORDER_DARK_GRAY, TEXT_DARK_GRAY_NORMAL),
+    "present": (BORDER_YELLOW, TEXT_YELLOW_NORMAL),
+    "correct": (BORDER_GREEN, TEXT_GREEN_NORMAL),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _build_table(letter: str, state: StateT, box: Box, bold: bool) -> Table:
+    """
+    Build the table renderable for a cell. There are only a few hundred distinct
+    (letter, state, box, bold) combinations, so results are cached and shared: rich
+    treats the table as immutable at render time, making reuse across cells safe.
+    """
+    border_style, text_style = (_STYLES_BOLD if bold else _STYLES_NORMAL)[state]
+
+    table = Table(box=box, show_header=False)
+    table.border_style = border_style
+    table.add_row(letter, style=text_style)
+
+    return table
+
 
-@attr.mutable(order=True, kw_only=True)
+@attr.mutable(order=True, kw_only=True, slots=True)
 class Cell:
     """A box/cell with a single letter, used in various parts of the game."""
 
     letter: str = attr.ib(default=" ", cmp=False)
     state: StateT = attr.ib(default="empty", cmp=STATE_ORDER.get)
+    state_rank: int = attr.ib(default=0, init=False, cmp=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.state_rank = STATE_ORDER[self.state]
+
+    def update(self, letter: str, state: StateT) -> None:
+        """Change this cell's letter and state in place."""
+        self.letter = letter
+        self.state = state
+        self.state_rank = STATE_ORDER[state]
 
     def _renderable(self, box: Box, bold: bool) -> RenderableType:
         """Return the rich renderable of this cell."""
-        table = Table(box=box, show_header=False)
-
-        match self.state:
-            case "empty":
-                border_style = Style(color=LIGHT_GRAY)
-                text_style = Style(bold=bold)
-            case "filled":
-                border_style = Style(color=LIGHT_GRAY)
-                text_style = Style(bold=bold)
-            case "absent":
-                border_style = Style(color=DARK_GRAY)
-                text_style = Style(color=DARK_GRAY, bold=bold)
-            case "present":
-                border_style = Style(color=YELLOW)
-                text_style = Style(color=YELLOW, bold=bold)
-            case "correct":
-                border_style = Style(color=GREEN)
-                text_style = Style(color=GREEN, bold=bold)
-
-        table.border_style = border_style
-        table.add_row(self.letter, style=text_style)
-
-        return table
+        return _build_table(self.letter, self.state, box, bold)
 
     def board_renderable(self) -> RenderableType:
         """Return a game cell with a single letter inside."""
@@ -92,36 +134,50 @@ class Cell:
         return self.letter
 
 
-@attr.mutable(kw_only=True)
+@attr.mutable(kw_only=True, slots=True)
 class BoardRow:
     """Represents 1 row of the board."""
 
     cells: list[Cell] = attr.ib(factory=lambda: [Cell() for _ in range(NUM_COLS)])
     input_index: int = attr.ib(default=0)
 
-    def submit(self, solution: str) -> list[Cell]:
+    def submit(
+        self,
+        solution_chars: tuple[str, ...],
+        solution_mask: int,
+        solution_counts: Counter[str],
+    ) -> list[Cell]:
         """
-        Checks these cells against the letters of solution and return if everything is
-        correct. Raises exceptions if the current word is too short or not a valid word.
+        Checks these cells against the solution (precomputed as positional letters, a
+        26-bit membership mask, and letter counts) and returns cells with new states.
+        Scoring is two-pass so duplicate guess letters are only marked present while
+        unmatched copies remain in the solution. Raises exceptions if the current word
+        is too short or not a valid word.
         """
         word = str(self).rstrip()
         if len(word) < NUM_COLS:
             raise TooShortException()
-        if word not in ALL_WORDS:
+        if word not in words.ALL_WORDS:
             raise NotAWordException()
 
-        new_cells = []
+        remaining = solution_counts.copy()
+        states: list[StateT] = ["absent"] * NUM_COLS
 
         for idx, letter in enumerate(word):
-            if letter == solution[idx]:
-                new_cell = Cell(letter=letter, state="correct")
-            elif letter in solution:
-                new_cell = Cell(letter=letter, state="present")
-            else:
-                new_cell = Cell(letter=letter, state="absent")
-            new_cells.append(new_cell)
+            if letter == solution_chars[idx]:
+                states[idx] = "correct"
+                remaining[letter] -= 1
 
-        return new_cells
+        for idx, letter in enumerate(word):
+            if (
+                states[idx] != "correct"
+                and solution_mask >> (ord(letter) - ord("A")) & 1
+                and remaining[letter] > 0
+            ):
+                states[idx] = "present"
+                remaining[letter] -= 1
+
+        return [Cell(letter=letter, state=state) for letter, state in zip(word, states)]
 
     @property
     def correct(self) -> bool:
@@ -136,7 +192,7 @@ class BoardRow:
         if self.input_index == NUM_COLS:
             raise FullRowException()
 
-        self.cells[self.input_index] = Cell(letter=letter.upper(), state="filled")
+        self.cells[self.input_index].update(letter.upper(), "filled")
         self.input_index += 1
 
     def delete_letter(self) -> None:
@@ -149,27 +205,48 @@ class BoardRow:
             raise EmptyRowException()
 
         self.input_index -= 1
-        self.cells[self.input_index] = Cell()
+        self.cells[self.input_index].update(" ", "empty")
 
     def __str__(self) -> str:
-        return "".join(str(cell) for cell in self.cells)
+        # unrolled over the fixed NUM_COLS cells: this runs on the hot keypress path
+        cells = self.cells
+        return (
+            cells[0].letter
+            + cells[1].letter
+            + cells[2].letter
+            + cells[3].letter
+            + cells[4].letter
+        )
 
 
-@attr.mutable(kw_only=True)
+@attr.mutable(kw_only=True, slots=True)
 class Board:
-    """The area where letters are input and checked against the solution."""
+    """
+    The area where letters are input and checked against the solution.
+
+    The rows' cell lists are the authoritative grid: reads and writes go through
+    them, and the rich renderables are derived from them on demand, never consulted
+    for game state.
+    """
 
     rows: list[BoardRow] = attr.ib(
         factory=lambda: [BoardRow() for _ in range(NUM_ROWS)]
     )
     active_row_index: int = attr.ib(default=0)
 
-    def submit(self, solution: str) -> list[Cell]:
+    def submit(
+        self,
+        solution_chars: tuple[str, ...],
+        solution_mask: int,
+        solution_counts: Counter[str],
+    ) -> list[Cell]:
         """
         Return a list of cells of the board's active row with states updated according
-        to the solution.
+        to the precomputed solution forms.
         """
-        checked_cells = self.rows[self.active_row_index].submit(solution)
+        checked_cells = self.rows[self.active_row_index].submit(
+            solution_chars, solution_mask, solution_counts
+        )
         self.active_row_index += 1
         return checked_cells
 
@@ -191,53 +268,78 @@ class Board:
         """The row the user just submitted."""
         return self.rows[self.active_row_index - 1]
 
-    def layout(self) -> Layout:
-        """A rich layout representing this board."""
-        board = Table.grid()
+    def renderable(self) -> RenderableType:
+        """Return the rich renderable of this board."""
+        grid = Table.grid()
         for row in self.rows:
-            board.add_row(*(cell.board_renderable() for cell in row.cells))
-        return Layout(Align.center(board), name="board", size=3 * NUM_ROWS)
+            grid.add_row(*(cell.board_renderable() for cell in row.cells))
+        return Align.center(grid)
+
+
+def _kb_index(letter: str) -> int:
+    """Return the index of an uppercase letter into the keyboard's cell array."""
+    return ord(letter) - ord("A")
 
 
-def _default_kb_cells() -> dict[str, Cell]:
-    cells_by_letter = {}
-    for row in KB_ROWS:
-        for letter in row:
-            cells_by_letter[letter] = Cell(letter=letter)
-    return cells_by_letter
+def _default_kb_cells() -> list[Cell]:
+    return [Cell(letter=chr(index + ord("A"))) for index in range(26)]
 
 
-@attr.mutable(kw_only=True)
+@attr.mutable(kw_only=True, slots=True)
 class Keyboard:
     """
     A status area that shows how each letter of the alphabet has been applied towards
     the solution.
     """
 
-    cells_by_letter: dict[str, Cell] = attr.ib(factory=_default_kb_cells)
-
-    def update(self, cell: Cell) -> None:
-        """Update the keyboard with the state of cell."""
-        self.cells_by_letter[cell.letter] = max(cell, self.cells_by_letter[cell.letter])
-
-    def layout(self) -> Layout:
-        """A rich layout representing this keyboard."""
-        layout = Layout(size=3 * 3)
+    cells: list[Cell] = attr.ib(factory=_default_kb_cells)
+    _row_cache: list[RenderableType | None] = attr.ib(
+        factory=lambda: [None] * len(KB_ROWS), init=False
+    )
 
-        for kb_row in KB_ROWS:
-            table = Table.grid()
-            table.add_row(
-                *(
-                    self.cells_by_letter[letter].keyboard_renderable()
-                    for letter in kb_row
-                )
+    def update(self, cell: Cell) -> bool:
+        """
+        Update the keyboard with the state of cell. Returns whether the letter's
+        displayed state actually changed.
+        """
+        index = _kb_index(cell.letter)
+        if cell.state_rank > self.cells[index].state_rank:
+            self.cells[index] = cell
+            self._row_cache[KB_LOCATION[cell.letter]] = None
+            return True
+        return False
+
+    def row_renderable(self, row_idx: int) -> RenderableType:
+        """
+        Return the rich renderable of one row of this keyboard, cached until a letter
+        in the row changes state.
+        """
+        cached = self._row_cache[row_idx]
+        if cached is not None:
+            return cached
+
+        table = Table.grid()
+        table.add_row(
+            *(
+                self.cells[_kb_index(letter)].keyboard_renderable()
+                for letter in KB_ROWS[row_idx]
             )
-            layout.add_split(Layout(Align.center(table), size=3))
+        )
+        renderable = Align.center(table)
+        self._row_cache[row_idx] = renderable
+        return renderable
+
 
-        return layout
+@functools.lru_cache(maxsize=64)
+def _render_markup(text: str) -> RenderableType:
+    """
+    Render status markup, cached by the raw text. The status cycles through a small
+    set of fixed messages, so re-parsing the markup each paint is wasted work.
+    """
+    return render(text)
 
 
-@attr.mutable(kw_only=True)
+@attr.mutable(kw_only=True, slots=True)
 class Status:
     """An area to communicate messages to the user."""
 
@@ -256,12 +358,22 @@ class Status:
         """Clear the status text."""
         self.text = ""
 
-    def layout(self) -> Layout:
-        """A rich layout representing this status."""
-        return Layout(Align.center(render(self.text)), size=1, name="status")
+    def renderable(self) -> RenderableType:
+        """Return the rich renderable of this status."""
+        return Align.center(_render_markup(self.text))
+
 
+def _build_layout() -> Layout:
+    layout = Layout()
+    layout.split_column(
+        Layout(name="status", size=1),
+        Layout(name="board", size=3 * NUM_ROWS),
+        *(Layout(name=region, size=3) for region in KB_ROW_REGIONS),
+    )
+    return layout
 
-@attr.mutable
+
+@attr.mutable(slots=True)
 class Game:
     """Represents a board state and solution of wordle."""
 
@@ -269,6 +381,60 @@ class Game:
     status: Status = attr.ib(factory=Status)
     board: Board = attr.ib(factory=Board)
     keyboard: Keyboard = attr.ib(factory=Keyboard)
+    animate: bool = attr.ib(default=True)
+    _refresh_suspended: bool = attr.ib(default=False, init=False)
+    _pending_refresh: bool = attr.ib(default=False, init=False)
+    _layout: Layout = attr.ib(factory=_build_layout, init=False)
+    _dirty: set[str] = attr.ib(
+        factory=lambda: {"status", "board", *KB_ROW_REGIONS}, init=False
+    )
+    _solution_chars: tuple[str, ...] = attr.ib(default=(), init=False)
+    _solution_mask: int = attr.ib(default=0, init=False)
+    _solution_counts: Counter[str] = attr.ib(factory=Counter, init=False)
+    _region_slots: dict[str, Layout] = attr.ib(factory=dict, init=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._solution_chars = tuple(self.solution)
+        for letter in self.solution:
+            self._solution_mask |= 1 << (ord(letter) - ord("A"))
+        self._solution_counts = Counter(self.solution)
+        # Layout name lookup walks the layout tree, so resolve each region once
+        self._region_slots = {
+            region: self._layout[region]
+            for region in ("status", "board", *KB_ROW_REGIONS)
+        }
+
+    def _mark_dirty(self, region: str) -> None:
+        """Flag a layout region for rebuild on the next refresh."""
+        self._dirty.add(region)
+
+    def _set_status(self, text: str) -> None:
+        """Set the status text, marking its region dirty only if the text changed."""
+        if text != self.status.text:
+            self.status.set(text)
+            self._mark_dirty("status")
+
+    @contextmanager
+    def _suspend_refresh(self, refresh_fn: Callable[[], None]) -> Iterator[None]:
+        """
+        Suspend refreshes for the duration of the block, then emit at most one
+        refresh on exit if any were requested inside it.
+        """
+        self._refresh_suspended = True
+        try:
+            yield
+        finally:
+            self._refresh_suspended = False
+            if self._pending_refresh:
+                self._pending_refresh = False
+                refresh_fn()
+
+    def _maybe_refresh(self, refresh_fn: Callable[[], None]) -> None:
+        """Request a refresh: deferred until suspension ends, or immediate."""
+        if self._refresh_suspended:
+            self._pending_refresh = True
+        else:
+            refresh_fn()
 
     def submit(self, refresh_fn: Callable[[], None]) -> None:
         """
@@ -281,29 +447,39 @@ class Game:
         If there's an issue, set an appropriate status.
         """
         try:
-            checked_cells = self.board.submit(self.solution)
+            checked_cells = self.board.submit(
+                self._solution_chars, self._solution_mask, self._solution_counts
+            )
         except TooShortException:
-            self.status.set("Not enough letters")
+            self._set_status("Not enough letters")
             return
         except NotAWordException:
-            self.status.set("Not in word list")
+            self._set_status("Not in word list")
             return
 
         for cell_idx, checked_cell in enumerate(checked_cells):
             self.board.submitted_row.cells[cell_idx] = checked_cell
-            self.keyboard.update(checked_cell)
-            time.sleep(0.1)
-            refresh_fn()
+            self._mark_dirty("board")
+            if self.keyboard.update(checked_cell):
+                self._mark_dirty(f"kb-row-{KB_LOCATION[checked_cell.letter]}")
+            if self.animate:
+                # animation frames intentionally bypass coalescing. no sleep after
+                # the last reveal: the next paint follows immediately.
+                refresh_fn()
+                if cell_idx < len(checked_cells) - 1:
+                    time.sleep(0.1)
 
         if self.board.submitted_row.correct:
-            self.status.set(RANKS[self.board.active_row_index - 1])
+            self._set_status(RANKS[self.board.active_row_index - 1])
             refresh_fn()
-            time.sleep(2)
+            if self.animate:
+                time.sleep(2)
             sys.exit(1)
         elif self.board.active_row_index == NUM_ROWS:
-            self.status.set(f"Correct word was [red]{self.solution}[/red]")
+            self._set_status(f"Correct word was [red]{self.solution}[/red]")
             refresh_fn()
-            time.sleep(2)
+            if self.animate:
+                time.sleep(2)
             sys.exit(1)
 
     def add_letter(self, letter: str) -> None:
@@ -311,55 +487,67 @@ class Game:
         try:
             self.board.add_letter(letter)
         except FullRowException:
-            self.status.set("Press Enter to submit")
+            self._set_status("Press Enter to submit")
+        else:
+            self._mark_dirty("board")
 
     def delete_letter(self) -> None:
         """Delete a letter, or set an appropriate status."""
         try:
             self.board.delete_letter()
         except EmptyRowException:
-            self.status.set("Can't erase anymore")
-
-    def handle_key(self, key: str, refresh_fn: Callable[[], None]) -> str:
-        """Respond to a keypress by the user."""
-        self.status.clear()
-
-        match key:
-            case key if key == "\x03":  # ctrl-c
-                sys.exit(1)
-            case key if key.upper() in string.ascii_uppercase:
-                self.add_letter(key)
-            case key if key == "\b":
-                self.delete_letter()
-            case key if key in "\r\n":
-                self.submit(refresh_fn)
-            case _:
-                self.status.set("Input a valid English letter")
-
-        # if no other status has been set, set to these help messages
-        if not self.status.text:
-            if (
-                self.board.active_row.input_index == 0
-                and self.board.active_row_index == 0
-            ):
-                self.status.set("Enter some letters...")
-            elif self.board.active_row.input_index == NUM_COLS:
-                self.status.set("Press Enter to submit")
+            self._set_status("Can't erase anymore")
+        else:
+            self._mark_dirty("board")
+
+    def handle_key(self, key: str, refresh_fn: Callable[[], None]) -> None:
+        """Respond to a keypress by the user, repainting at most once."""
+        with self._suspend_refresh(refresh_fn):
+            self._set_status("")
+
+            match key:
+                case key if key == "\x03":  # ctrl-c
+                    sys.exit(1)
+                case key if "A" <= key <= "Z" or "a" <= key <= "z":
+                    self.add_letter(key)
+                case key if key == "\b":
+                    self.delete_letter()
+                case key if key in "\r\n":
+                    self.submit(refresh_fn)
+                case _:
+                    self._set_status("Input a valid English letter")
+
+            # if no other status has been set, set to these help messages
+            if not self.status.text:
+                if (
+                    self.board.active_row.input_index == 0
+                    and self.board.active_row_index == 0
+                ):
+                    self._set_status("Enter some letters...")
+                elif self.board.active_row.input_index == NUM_COLS:
+                    self._set_status("Press Enter to submit")
+
+            self._maybe_refresh(refresh_fn)
 
     def play(self) -> None:
         """Play the game."""
         with Live(self, auto_refresh=False) as live:
             while True:
-                self.handle_key(key=getch(), refresh_fn=live.refresh)
-                live.refresh()
+                key = getch()
+                if key is not None:
+                    self.handle_key(key=key, refresh_fn=live.refresh)
 
     def __rich__(self) -> RenderableType:
-        """Return the rich renderable of this game."""
-
-        layout = Layout()
-        layout.split_column(
-            self.status.layout(),
-            self.board.layout(),
-            self.keyboard.layout(),
-        )
-        return layout
+        """Return the rich renderable of this game, rebuilding only dirty regions."""
+        for region in self._dirty:
+            match region:
+                case "status":
+                    renderable = self.status.renderable()
+                case "board":
+                    renderable = self.board.renderable()
+                case _:
+                    row_idx = int(region.rsplit("-", maxsplit=1)[1])
+                    renderable = self.keyboard.row_renderable(row_idx)
+            self._region_slots[region].update(renderable)
+        self._dirty.clear()
+        return self._layout
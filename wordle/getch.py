@@ -3,29 +3,56 @@ Cross-platform stdin character getting.
 
 From: https://stackoverflow.com/a/510364/235992
 """
+
 # pylint: disable=import-error
 
 import platform
 
 if platform.system() == "Windows":
     import msvcrt
+    import time
 
-    def getch() -> str:
-        """Return the next character of input."""
+    def getch(timeout: float | None = None) -> str | None:
+        """
+        Return the next character of input, or None if timeout seconds elapse
+        without one. A timeout of None blocks until a character arrives.
+        """
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.01)
         return msvcrt.getch().decode("utf-8")
 
 else:
+    import os
+    import selectors
     import sys
     import termios
     import tty
 
-    def getch() -> str:
-        """Return the next character of input."""
+    def getch(timeout: float | None = None) -> str | None:
+        """
+        Return the next character of input, or None if timeout seconds elapse
+        without one. A timeout of None blocks until a character arrives.
+        """
         file_desc = sys.stdin.fileno()
         old_settings = termios.tcgetattr(file_desc)
         try:
-            tty.setraw(file_desc)
-            character = sys.stdin.read(1)
+            # TCSADRAIN, not the default TCSAFLUSH: flushing would discard any
+            # keys typed between calls, now that nothing read-ahead buffers them
+            tty.setraw(file_desc, termios.TCSADRAIN)
+            if timeout is not None:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(file_desc, selectors.EVENT_READ)
+                    if not selector.select(timeout):
+                        return None
+            # an unbuffered read, so nothing is slurped past the one byte the
+            # selector saw
+            byte = os.read(file_desc, 1)
         finally:
             termios.tcsetattr(file_desc, termios.TCSADRAIN, old_settings)
-        return character
+        # one byte is always one character in latin-1, so this skips the text
+        # stream's incremental decoder machinery
+        return byte.decode("latin-1")
@@ -1,25 +1,78 @@
 """The solutions and allowable words of the game."""
+
+import functools
+import pickle
 import random
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import arrow
 
 WORDS_PATH = Path(__file__).parent / "words.txt"
 SOLUTIONS_PATH = Path(__file__).parent / "solutions.txt"
+PICKLE_PATH = Path(__file__).parent / "words.pkl"
 
 
 def load_words(path: Path) -> list[str]:
-    """Return a list of whitespace-stripped words from each line of a file at path."""
-    with path.open("r") as word_file:
-        return [word.strip().upper() for word in word_file]
+    """
+    Return a list of uppercased words from a whitespace-separated file at path. The
+    file is read and uppercased as one binary blob, rather than line by line, since
+    the lists are ~13k words long.
+    """
+    with path.open("rb") as word_file:
+        return word_file.read().upper().decode("ascii").split()
 
 
-# this is a list, to support random.choice
-SOLUTIONS = load_words(SOLUTIONS_PATH)
+@functools.cache
+def _word_lists() -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Load the word lists once, preferring the precompiled pickle written by
+    tools/build_wordlists.py (make wordlists) and falling back to parsing the text
+    files if it is absent.
+    """
+    try:
+        with PICKLE_PATH.open("rb") as pickle_file:
+            word_lists: tuple[tuple[str, ...], frozenset[str]] = pickle.load(
+                pickle_file
+            )
+            return word_lists
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return build_word_lists()
+
+
+def build_word_lists() -> tuple[tuple[str, ...], frozenset[str]]:
+    """
+    Parse the text word lists into their runtime forms: the solutions as a tuple (an
+    indexable sequence, to support random.choice and word_of_the_day) and every
+    allowable word as a frozenset (to support O(1) membership checking).
+    """
+    solutions = tuple(load_words(SOLUTIONS_PATH))
+    all_words = frozenset(load_words(WORDS_PATH)).union(solutions)
+    return solutions, all_words
+
+
+def _solutions() -> tuple[str, ...]:
+    """The solution words."""
+    return _word_lists()[0]
+
+
+def _all_words() -> frozenset[str]:
+    """Every allowable word."""
+    return _word_lists()[1]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily expose SOLUTIONS and ALL_WORDS (PEP 562), so that paths which never look at
+    the word lists (such as --help) skip parsing them entirely.
+    """
+    match name:
+        case "SOLUTIONS":
+            return _solutions()
+        case "ALL_WORDS":
+            return _all_words()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# this is a set, to support O(1) membership checking
-ALL_WORDS = set(load_words(WORDS_PATH)) | set(SOLUTIONS)
 
 # reference date to calculate index of word of the day. comes from the offical game.
 _REFERENCE_DATE = arrow.Arrow(2021, 6, 19, tzinfo="local")
@@ -37,11 +90,12 @@ def word_of_the_day(date: Optional[arrow.Arrow] = None) -> str:
     """
     if date is None:
         date = arrow.now()
+    solutions = _solutions()
     delta = date - _REFERENCE_DATE
-    index = delta.days % len(SOLUTIONS)
-    return SOLUTIONS[index]
+    index = delta.days % len(solutions)
+    return solutions[index]
 
 
 def random_word() -> str:
     """Return a random word for the SOLUTIONS list."""
-    return random.choice(SOLUTIONS)
+    return random.choice(_solutions())